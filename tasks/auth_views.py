@@ -5,6 +5,7 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework import status
+from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.views.decorators.csrf import csrf_exempt
@@ -80,8 +81,6 @@ def login(request):
     body: {"username": "user", "password": "pass"}
     """
     try:
-        from django.contrib.auth import authenticate
-        
         username = request.data.get('username')
         password = request.data.get('password')
         
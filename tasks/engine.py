@@ -3,8 +3,8 @@ import math
 
 class SmartScoringEngine:
     @staticmethod
-    def calculate_score(task):
-        today = date.today()
+    def calculate_score(task, blocking_count=None, today=None):
+        today = today or date.today()
         
         # 1. URGENCY (Exponential Decay)
         days_until = (task.due_date - today).days
@@ -19,17 +19,22 @@ class SmartScoringEngine:
         effort_bonus = 10 / max(task.estimated_hours, 1)
 
         # 4. DEPENDENCIES (Graph Weight)
-        dep_bonus = task.blocking.count() * 5
+        # Callers scoring many tasks pass a precomputed count to avoid a COUNT query per task
+        if blocking_count is None:
+            blocking_count = task.blocking.count()
+        dep_bonus = blocking_count * 5
 
         return round(urgency + imp_score + effort_bonus + dep_bonus, 2)
 
     @staticmethod
-    def generate_explanation(task, score):
-        days = (task.due_date - date.today()).days
+    def generate_explanation(task, score, today=None, blocking_count=None):
+        days = (task.due_date - (today or date.today())).days
+        if blocking_count is None:
+            blocking_count = task.blocking.count()
         reasons = []
         if days <= 1: reasons.append("Due very soon")
         if task.importance >= 8: reasons.append("High Importance")
-        if task.blocking.count() > 0: reasons.append(f"Blocks {task.blocking.count()} tasks")
+        if blocking_count > 0: reasons.append(f"Blocks {blocking_count} tasks")
         if task.estimated_hours < 2: reasons.append("Quick win")
         
         return ", ".join(reasons) if reasons else "Standard priority"
\ No newline at end of file
@@ -0,0 +1,18 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    """JSONRenderer backed by orjson for large analyze payloads."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        # Indented output (e.g. the browsable API) keeps DRF's own formatting
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        # Types orjson can't handle natively (Decimal, lazy strings, ...) fall back to DRF's encoder
+        ret = orjson.dumps(data, default=JSONEncoder().default)
+        # Escape U+2028/U+2029 like JSONRenderer so the output stays valid JavaScript
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
@@ -1,4 +1,5 @@
 from django.test import TestCase
+from rest_framework.test import APIClient
 from datetime import date, timedelta
 from .models import Task
 from .engine import SmartScoringEngine
@@ -24,4 +25,54 @@ class AlgorithmTests(TestCase):
         """Short tasks should outscore long tasks (all else equal)"""
         short = Task.objects.create(title="Short", due_date=date.today(), estimated_hours=1, importance=5)
         long_task = Task.objects.create(title="Long", due_date=date.today(), estimated_hours=10, importance=5)
-        self.assertTrue(SmartScoringEngine.calculate_score(short) > SmartScoringEngine.calculate_score(long_task))
\ No newline at end of file
+        self.assertTrue(SmartScoringEngine.calculate_score(short) > SmartScoringEngine.calculate_score(long_task))
+
+    def test_precomputed_blocking_count(self):
+        """A precomputed blocking count should match the queried one"""
+        blocker = Task.objects.create(title="Blocker", due_date=date.today(), estimated_hours=1, importance=5)
+        dependent = Task.objects.create(title="Dependent", due_date=date.today(), estimated_hours=1, importance=5)
+        blocker.blocking.add(dependent)
+        self.assertEqual(SmartScoringEngine.calculate_score(blocker, 1), SmartScoringEngine.calculate_score(blocker))
+
+
+class AnalyzeViewTests(TestCase):
+    def test_query_count_is_constant(self):
+        """Analyzing should not issue queries per task"""
+        tasks = [Task.objects.create(title=f"Task {i}", due_date=date.today()+timedelta(days=i), estimated_hours=i+1, importance=5) for i in range(5)]
+        tasks[0].blocking.add(*tasks[1:])
+        # 1 task query + 2 prefetches
+        with self.assertNumQueries(3):
+            response = APIClient().post('/api/tasks/analyze/', {'strategy': 'smart_balance'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data[0]['id'], tasks[0].id)
+        self.assertEqual(response.data[1]['dependencies'], [tasks[0].id])
+        self.assertIn("Blocks 4 tasks", response.data[0]['explanation'])
+
+    def test_response_is_json(self):
+        """Analyze responses should render as plain JSON, matching DRF's JSONRenderer"""
+        task = Task.objects.create(title="Line\u2028Break", due_date=date.today(), estimated_hours=1, importance=5)
+        client = APIClient()
+        response = client.post('/api/tasks/analyze/', {'strategy': 'impact'}, format='json')
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.json()[0]['id'], task.id)
+        self.assertEqual(response.json()[0]['score'], 50)
+        # Line separators are escaped and indent requests are honoured
+        self.assertIn(b'Line\\u2028Break', response.content)
+        response = client.post('/api/tasks/analyze/', {'strategy': 'impact'}, format='json', HTTP_ACCEPT='application/json; indent=4')
+        self.assertIn(b'\n        "title"', response.content)
+
+    def test_strategies(self):
+        """Each strategy should rank by its own criterion"""
+        soon = Task.objects.create(title="Soon", due_date=date.today(), estimated_hours=8, importance=2)
+        big = Task.objects.create(title="Big", due_date=date.today()+timedelta(days=5), estimated_hours=6, importance=9)
+        quick = Task.objects.create(title="Quick", due_date=date.today()+timedelta(days=9), estimated_hours=1, importance=3)
+        client = APIClient()
+        for strategy, expected in (('deadline', soon), ('impact', big), ('quick_wins', quick)):
+            response = client.post('/api/tasks/analyze/', {'strategy': strategy}, format='json')
+            self.assertEqual(response.data[0]['id'], expected.id)
+        # Non-string strategies fall back to smart balance
+        smart = client.post('/api/tasks/analyze/', {'strategy': 'smart_balance'}, format='json')
+        for strategy in (['deadline'], {'a': 1}):
+            response = client.post('/api/tasks/analyze/', {'strategy': strategy}, format='json')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data, smart.data)
\ No newline at end of file
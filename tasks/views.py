@@ -1,51 +1,68 @@
 from rest_framework import generics
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from rest_framework.renderers import BrowsableAPIRenderer
 from .models import Task
 from .serializers import TaskSerializer
 from .engine import SmartScoringEngine
+from .renderers import ORJSONRenderer
 from datetime import date
+from operator import itemgetter
 
 # 1. API to Create New Tasks (This makes the form work)
 class TaskCreateView(generics.CreateAPIView):
     queryset = Task.objects.all()
     serializer_class = TaskSerializer
 
+# --- STRATEGY LOGIC ---
+# Each strategy maps (task, today) -> (score, explanation)
+def deadline_strategy(task, today):
+    days = (task.due_date - today).days
+    # Lower days = higher score (urgent)
+    return 100 - (days * 2), f"Due in {days} days"
+
+def impact_strategy(task, today):
+    # Importance is king
+    return task.importance * 10, f"Importance Rating: {task.importance}/10"
+
+def quick_wins_strategy(task, today):
+    # Shortest tasks first
+    return 100 - (task.estimated_hours * 2), f"Takes {task.estimated_hours} hours"
+
+def smart_balance_strategy(task, today):
+    # SMART BALANCE (Your Algorithm)
+    # Answered from the prefetch cache when 'blocking' is prefetched
+    blocking_count = task.blocking.count()
+    score = SmartScoringEngine.calculate_score(task, blocking_count, today)
+    return score, SmartScoringEngine.generate_explanation(task, score, today, blocking_count)
+
+STRATEGIES = {
+    'deadline': deadline_strategy,
+    'impact': impact_strategy,
+    'quick_wins': quick_wins_strategy,
+    'smart_balance': smart_balance_strategy,
+}
+
 # 2. API to Analyze and Sort Tasks
 class TaskAnalyzeView(APIView):
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+
     def post(self, request):
-        # Fetch uncompleted tasks
-        tasks = Task.objects.filter(completed=False)
-        strategy = request.data.get('strategy', 'smart_balance')
+        # Fetch uncompleted tasks (prefetch both sides of the dependency graph)
+        tasks = list(Task.objects.filter(completed=False).prefetch_related('blocking', 'dependencies'))
+        # Resolve the strategy once; unknown or non-string values fall back to smart balance
+        strategy = request.data.get('strategy')
+        score_task = STRATEGIES.get(strategy, smart_balance_strategy) if isinstance(strategy, str) else smart_balance_strategy
+        today = date.today()
+        
+        # Serialize every task with a single serializer instance
+        serialized = TaskSerializer(tasks, many=True).data
         
         results = []
-        for task in tasks:
-            data = TaskSerializer(task).data
-            
-            # --- STRATEGY LOGIC ---
-            if strategy == 'deadline':
-                days = (task.due_date - date.today()).days
-                # Lower days = higher score (urgent)
-                data['score'] = 100 - (days * 2)
-                data['explanation'] = f"Due in {days} days"
-                
-            elif strategy == 'impact':
-                # Importance is king
-                data['score'] = task.importance * 10
-                data['explanation'] = f"Importance Rating: {task.importance}/10"
-                
-            elif strategy == 'quick_wins':
-                # Shortest tasks first
-                data['score'] = 100 - (task.estimated_hours * 2)
-                data['explanation'] = f"Takes {task.estimated_hours} hours"
-                
-            else:
-                # SMART BALANCE (Your Algorithm)
-                data['score'] = SmartScoringEngine.calculate_score(task)
-                data['explanation'] = SmartScoringEngine.generate_explanation(task, data['score'])
-            
+        for task, data in zip(tasks, serialized):
+            data['score'], data['explanation'] = score_task(task, today)
             results.append(data)
 
-        # Sort descending by score
-        sorted_results = sorted(results, key=lambda x: x['score'], reverse=True)
-        return Response(sorted_results)
\ No newline at end of file
+        # Sort descending by score (in place; key is extracted once per row)
+        results.sort(key=itemgetter('score'), reverse=True)
+        return Response(results)
\ No newline at end of file